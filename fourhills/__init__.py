@@ -1,8 +1,4 @@
-from .setting import Setting
-from .stats import StatBlock
-from .npc import Npc
-from .cheatsheet import Cheatsheet
-from .scene import Scene
+import importlib
 
 name = "fourhills"
 
@@ -13,3 +9,28 @@ __all__ = [
     "Cheatsheet",
     "Scene",
 ]
+
+# The submodule defining each public class. They are imported on first access, so
+# that importing fourhills (e.g. to run `fh --help`) doesn't pull in yaml.
+_MODULES = {
+    "Npc": "fourhills.npc",
+    "Setting": "fourhills.setting",
+    "StatBlock": "fourhills.stats",
+    "Cheatsheet": "fourhills.cheatsheet",
+    "Scene": "fourhills.scene",
+}
+
+
+def __getattr__(attr):
+    try:
+        module_name = _MODULES[attr]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache it in the module namespace so __getattr__ isn't called again
+    globals()[attr] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
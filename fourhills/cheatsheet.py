@@ -4,6 +4,7 @@ from typing import List
 from fourhills import Setting
 from fourhills.exceptions import FourhillsFileLoadError, FourhillsFileNameError
 from fourhills.text_utils import wrap_lines_paragraph, title
+from fourhills.yaml_utils import safe_load
 
 
 @dataclass
@@ -62,7 +63,7 @@ class Cheatsheet:
             )
         with open(cheatsheet_file) as f:
             try:
-                cheatsheet_dict = yaml.safe_load(f)
+                cheatsheet_dict = safe_load(f)
             except yaml.YAMLError as exc:
                 raise FourhillsFileLoadError(
                     f"Error loading from {cheatsheet_file}."
@@ -1,11 +1,67 @@
 import click
-from fourhills import Scene, Setting, Cheatsheet
+from typing import Iterable, List
 from fourhills.text_utils import display_panes
 from fourhills.exceptions import FourhillsSettingStructureError, FourhillsFileNameError
 
 SCENE_FILENAME = "scene.yaml"
 
 
+class PrefixTrie:
+    """A character trie of names, used to find the names that start with a prefix."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        """Initialise the trie.
+
+        Parameters
+        ----------
+        names : iterable of str
+            The names to add to the trie.
+        """
+        # Each node is a dict from a character to the next node. The None key marks
+        # the end of a name, and maps to the full name.
+        self._root: dict = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str):
+        """Add a name to the trie."""
+        node = self._root
+        for character in name:
+            node = node.setdefault(character, {})
+        node[None] = name
+
+    def names_with_prefix(self, prefix: str) -> List[str]:
+        """Return the names which start with `prefix`.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix to look for.
+
+        Returns
+        -------
+        list of str
+            The names starting with `prefix`, in sorted order.
+        """
+        # Walk down to the node for the prefix
+        node = self._root
+        for character in prefix:
+            node = node.get(character)
+            if node is None:
+                return []
+        # Collect all of the names in the subtree below that node
+        names = list()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for character, child in node.items():
+                if character is None:
+                    names.append(child)
+                else:
+                    stack.append(child)
+        return sorted(names)
+
+
 class AliasedGroup(click.Group):
     """Click group that accepts unique prefixes of a command as the command.
 
@@ -16,11 +72,20 @@ class AliasedGroup(click.Group):
 
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Trie of the command names, for matching prefixes
+        self._command_trie = PrefixTrie(self.commands)
+
+    def add_command(self, cmd, name=None):
+        super().add_command(cmd, name)
+        self._command_trie.add(name or cmd.name)
+
     def get_command(self, ctx, cmd_name):
         rv = click.Group.get_command(self, ctx, cmd_name)
         if rv is not None:
             return rv
-        matches = [x for x in self.list_commands(ctx) if x.startswith(cmd_name)]
+        matches = self._command_trie.names_with_prefix(cmd_name)
         if not matches:
             return None
         elif len(matches) == 1:
@@ -29,8 +94,12 @@ class AliasedGroup(click.Group):
 
 
 def get_setting(click_ctx):
+    # Imported here rather than at the top of the module so that commands which
+    # don't need a setting (e.g. --help) start faster.
+    from fourhills import Setting
+
     try:
-        return Setting()
+        return Setting(use_cache=click_ctx.obj["use_cache"])
     except FourhillsSettingStructureError as e:
         click_ctx.fail(
             f"Current directory does not appear to part of a valid setting: {str(e)}"
@@ -38,6 +107,8 @@ def get_setting(click_ctx):
 
 
 def get_scene(click_ctx):
+    from fourhills import Scene
+
     try:
         return Scene.from_file(SCENE_FILENAME, setting=get_setting(click_ctx))
     except FileNotFoundError:
@@ -46,8 +117,16 @@ def get_scene(click_ctx):
 
 @click.group(cls=AliasedGroup)
 @click.version_option(message="Fourhills version %(version)s")
-def cli():
-    pass
+@click.option(
+    "--no-cache",
+    help="Re-read every file rather than reusing earlier loads (for debugging).",
+    is_flag=True,
+)
+@click.pass_context
+def cli(ctx, no_cache):
+    # Options shared with the subcommands, which inherit ctx.obj
+    ctx.ensure_object(dict)
+    ctx.obj["use_cache"] = not no_cache
 
 
 @cli.command()
@@ -71,9 +150,30 @@ def scene(ctx):
     get_scene(ctx).display_scene()
 
 
+@cli.command()
+@click.pass_context
+def monsters(ctx):
+    """List the monsters in the setting, with their challenge and creature type."""
+    from fourhills import StatBlock
+
+    setting = get_setting(ctx)
+    names = setting.filenames_of_type_in_dir("yaml", setting.monsters_dir)
+    for name in sorted(names):
+        # Only the start of each file is read, not the whole stat block
+        header = StatBlock.peek_header(
+            setting.monsters_dir / (name + ".yaml"), use_cache=setting.use_cache
+        )
+        click.echo(
+            f"{name}: {header['name']}, challenge {header['challenge']} "
+            f"({header['creature_type']})"
+        )
+
+
 def list_cheatsheets(ctx, param, value):
     if not value or ctx.resilient_parsing:
         return
+    from fourhills import Cheatsheet
+
     setting = get_setting(ctx)
     click.echo("  ".join(Cheatsheet.cheatsheet_names(setting)))
     ctx.exit()
@@ -97,6 +197,8 @@ def cheatsheet(ctx, cheatsheet_name):
     Cheatsheets are referred to according to their filename in the cheatsheets
     directory, excluding the .yaml extension.
     """
+    from fourhills import Cheatsheet
+
     setting = get_setting(ctx)
 
     try:
@@ -4,6 +4,7 @@ from typing import Optional, List, Dict
 from fourhills import Setting, StatBlock
 from fourhills.exceptions import FourhillsFileLoadError, FourhillsFileNameError
 from fourhills.text_utils import wrap_lines_paragraph, title
+from fourhills.yaml_utils import safe_load
 
 
 @dataclass
@@ -20,7 +21,7 @@ class Npc:
     stats: Optional[Dict] = None
 
     def __str__(self):
-        return self.summary_info(line_width=80)
+        return "\n".join(self.summary_info(line_width=80))
 
     def summary_info(self, line_width: int = 80) -> List[str]:
         """Return a list of lines summarising the NPC.
@@ -48,13 +49,18 @@ class Npc:
 
         return wrap_lines_paragraph(lines, line_width)
 
-    def battle_info(self, line_width: int = 80) -> List[str]:
+    def battle_info(
+        self, line_width: int = 80, out: Optional[List[str]] = None
+    ) -> List[str]:
         """Return a list of lines detailing the NPC's stats.
 
         Parameters
         ----------
         line_width : int
             The width of the output, in characters.
+        out : list of str or None
+            If a list, the lines are appended to it and it is returned. If None, a
+            new list is created.
 
         Returns
         -------
@@ -62,9 +68,10 @@ class Npc:
             A representation of the NPC's stats as a list of lines.
         """
         if self.stats:
-            return self.stats.battle_info(line_width)
-        else:
-            return ["This NPC has no stats defined"]
+            return self.stats.battle_info(line_width, out)
+        lines = list() if out is None else out
+        lines.append("This NPC has no stats defined")
+        return lines
 
     def character_info(self, line_width: int = 80) -> List[str]:
         """Return a list of lines describing the NPC.
@@ -114,7 +121,7 @@ class Npc:
             raise FourhillsFileNameError(f"NPC file {npc_file} does not exist.")
         with open(npc_file) as f:
             try:
-                npc_dict = yaml.safe_load(f)
+                npc_dict = safe_load(f)
             except yaml.YAMLError as exc:
                 raise FourhillsFileLoadError(f"Error loading from {npc_file}.") from exc
 
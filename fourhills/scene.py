@@ -4,6 +4,10 @@ from typing import List, Tuple, Optional
 from fourhills import Setting, StatBlock, Npc
 from fourhills.exceptions import FourhillsFileLoadError
 from fourhills.text_utils import display_panes, title
+from fourhills.yaml_utils import safe_load
+
+# Matches a monster entry in a scene file, e.g. "goblin x3", capturing name and number
+MONSTER_ENTRY_RE = re.compile(r"^(\w*)(?: ?x?(\d+))?$")
 
 
 class Scene:
@@ -43,7 +47,7 @@ class Scene:
         """
         with open(filename) as f:
             try:
-                scene_info = yaml.safe_load(f)
+                scene_info = safe_load(f)
             except yaml.YAMLError as exc:
                 raise FourhillsFileLoadError(f"Error loading from {filename}.") from exc
 
@@ -54,7 +58,7 @@ class Scene:
             if "monsters" in scene_info:
                 for monster_name_number in scene_info["monsters"]:
                     # See if it matches the expected format, extracting name and number
-                    match = re.match(r"^(\w*)(?: ?x?(\d+))?$", monster_name_number)
+                    match = MONSTER_ENTRY_RE.match(monster_name_number)
                     if not match:
                         raise FourhillsFileLoadError(
                             "Error parsing monster in scene file"
@@ -78,23 +82,31 @@ class Scene:
 
             return cls(monster_info, npc_info, setting)
 
+    def load_monsters(self) -> List[Tuple[StatBlock, int]]:
+        """Load the stat blocks of the monsters in the scene.
+
+        Returns
+        -------
+        list of tuples of StatBlock, int
+            The stat block of each monster and the quantity of it, in scene order.
+        """
+        return [
+            (StatBlock.from_name(monster_name, self.setting), quantity)
+            for monster_name, quantity in self.monster_names_quantities
+        ]
+
     def display_battle(self):
         """Display statistsics for battle."""
         panes = list()
 
-        for monster_name, quantity in self.monster_names_quantities:
-            monster = StatBlock.from_name(monster_name, self.setting)
-            panes.append(
-                monster.summary_info(self.setting.pane_width, quantity)
-                + monster.battle_info(self.setting.pane_width)
-            )
+        for monster, quantity in self.load_monsters():
+            lines = monster.summary_info(self.setting.pane_width, quantity)
+            panes.append(monster.battle_info(self.setting.pane_width, out=lines))
 
         for npc_name in self.npc_names:
             npc = Npc.from_name(npc_name, self.setting)
-            panes.append(
-                npc.summary_info(self.setting.pane_width)
-                + npc.battle_info(self.setting.pane_width)
-            )
+            lines = npc.summary_info(self.setting.pane_width)
+            panes.append(npc.battle_info(self.setting.pane_width, out=lines))
 
         display_panes(panes, self.setting.panes, self.setting.pane_width)
 
@@ -116,14 +128,7 @@ class Scene:
         panes = list()
 
         # List of all of the monsters at the location, and the quantities of each
-        monsters_quantities = (
-            [
-                (StatBlock.from_name(monster_name, self.setting), quantity)
-                for monster_name, quantity in self.monster_names_quantities
-            ]
-            if self.monster_names_quantities
-            else []
-        )
+        monsters_quantities = self.load_monsters()
 
         # List of all of the NPCs at the location
         npcs = (
@@ -16,10 +16,12 @@ class Setting:
         "cheatsheets": "cheatsheets",
     }
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.root = self.find_root()
         self.pane_width = 56
         self.panes = 2
+        # Whether files loaded earlier in the process can be reused
+        self.use_cache = use_cache
 
     @staticmethod
     def find_root() -> Optional[Path]:
@@ -1,26 +1,142 @@
+import os
 import sys
-import math
+from stat import S_ISREG
+import functools
 import yaml
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+import dataclasses
+from dataclasses import dataclass, field
+from typing import ClassVar, FrozenSet, Optional, Dict, List, Tuple
 from fourhills import Setting
 from fourhills.text_utils import (
     format_indented_paragraph,
     format_list,
     centre_pad,
+    separator,
     title,
 )
+from fourhills.yaml_utils import (
+    intern,
+    load_mapping,
+    read_top_level_scalars,
+    safe_load,
+)
 from fourhills.exceptions import (
     FourhillsError,
     FourhillsFileLoadError,
     FourhillsFileNameError,
 )
 
+# StatBlocks loaded by `StatBlock.from_file`, keyed on file path. Each value is the
+# file's mtime (in ns) when it was loaded, and the StatBlock.
+_STATBLOCK_CACHE: Dict[str, Tuple[int, "StatBlock"]] = {}
+
+# Templates for the attacks in `StatBlock.battle_info`, filled in from each attack's
+# details plus its capitalised name
+_MELEE_ATTACK_TEMPLATE = (
+    "{name_cap}: melee weapon attack, {hit} to hit, reach {reach}, {targets}. "
+    "Hit damage: {damage}."
+)
+_RANGED_ATTACK_TEMPLATE = (
+    "{name_cap}: ranged weapon attack, {hit} to hit, range {range},{targets}. "
+    "Hit damage: {damage}."
+)
+
+# Lists in stat files whose items are interned, as they repeat across monsters
+_INTERNED_LISTS = (
+    "damage_vulnerabilities",
+    "damage_resistances",
+    "damage_immunities",
+    "condition_immunities",
+)
+
+
+def _intern_keys(obj):
+    """Return a copy of `obj` with the keys of any (nested) dicts passed to `intern`.
+
+    Notes
+    -----
+    Keys such as ability names and skills are the same across many stat files, so
+    interning them saves memory and lets dict lookups compare them by identity.
+    `load_mapping` already interns keys as it builds the dicts, so this is only
+    needed for documents loaded with `safe_load`.
+    """
+    if isinstance(obj, dict):
+        return {intern(key): _intern_keys(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    return obj
+
+
+def _load_stat_dict(filename: str, keys: FrozenSet[str]) -> dict:
+    """Load the stat dictionary from a YAML file.
+
+    Parameters
+    ----------
+    filename: str
+        Path to the YAML file
+    keys: frozenset of str
+        The top-level keys a stat file can have.
+
+    Returns
+    -------
+    dict
+        The parsed contents of the file.
+    """
+    with open(filename) as f:
+        text = f.read()
+    try:
+        # Parse straight from the event stream if possible, as it's faster
+        stat_dict = load_mapping(text, keys)
+        if stat_dict is None:
+            stat_dict = _intern_keys(safe_load(text))
+    except yaml.YAMLError as exc:
+        raise FourhillsFileLoadError(f"Error loading from {filename}.") from exc
+    if not isinstance(stat_dict, dict):
+        raise FourhillsFileLoadError(
+            f"Error loading from {filename}: the file is not a mapping of stats."
+        )
+    # Damage and condition types come from a small set, so share them too
+    for list_key in _INTERNED_LISTS:
+        if isinstance(stat_dict.get(list_key), list):
+            stat_dict[list_key] = [intern(item) for item in stat_dict[list_key]]
+    return stat_dict
+
+
+@functools.lru_cache(maxsize=8)
+def _ability_row_template(line_width: int, count: int) -> str:
+    """Return a format template for a row of ability names or scores.
+
+    Each of the `count` values is centred in an equal share of the line width. The
+    filled-in row still needs centring in the line width with `centre_pad`, as a
+    value wider than its share widens the row.
+
+    Parameters
+    ----------
+    line_width : int
+        The width of the output, in characters.
+    count : int
+        The number of abilities in the row.
+
+    Returns
+    -------
+    str
+        The template, with one replacement field per ability.
+    """
+    ability_width = line_width // count
+    return f"{{:^{ability_width}}}" * count
 
-@dataclass
+
+# Slotted dataclasses (which drop the per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class StatBlock:
     """The stat block for a monster or character."""
 
+    # The keys read by `peek_header`
+    HEADER_KEYS: ClassVar[Tuple[str, ...]] = ("name", "challenge", "creature_type")
+
     name: str
     size: str
     creature_type: str
@@ -45,9 +161,15 @@ class StatBlock:
     multiattack: Optional[str] = None
     other_actions: Optional[Dict[str, str]] = None
     description: Optional[str] = None
+    # The "score(modifier)" strings shown in battle_info, built on first use. This is
+    # the only attribute written after creation, even on StatBlocks shared through
+    # the cache.
+    _ability_cells: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self):
-        return self.summary_info(line_width=80)
+        return "\n".join(self.summary_info(line_width=80))
 
     @property
     def xp(self):
@@ -117,7 +239,7 @@ class StatBlock:
         int
             The ability modifier.
         """
-        return math.floor((ability_score - 10) / 2)
+        return (ability_score - 10) // 2
 
     def summary_info(
         self, line_width: int = 80, quantity: Optional[int] = None
@@ -146,13 +268,18 @@ class StatBlock:
 
         return lines
 
-    def battle_info(self, line_width: int = 80) -> List[str]:
+    def battle_info(
+        self, line_width: int = 80, out: Optional[List[str]] = None
+    ) -> List[str]:
         """Return the battle info for the stat block as a list of lines.
 
         Parameters
         ----------
         line_width : int
             The width of the output, in characters.
+        out : list of str or None
+            If a list, the lines are appended to it and it is returned. If None, a
+            new list is created.
 
         Returns
         -------
@@ -171,7 +298,7 @@ class StatBlock:
             )
 
         # List to hold the lines of the output.
-        lines = list()
+        lines = list() if out is None else out
 
         # AC, HP, speed
         lines.append(f"AC {self.ac}")
@@ -179,61 +306,54 @@ class StatBlock:
         lines.append(f"Speed {self.speed}")
 
         # Separator
-        lines.append("-" * line_width)
-
-        # Abilities
-        ability_width = math.floor(line_width / len(self.ability))
-        # Lists to hold the name and score strings for the abilities
-        ability_name_strings = list()
-        ability_score_strings = list()
-        # Go through the abilities, generating padded strings for the name and score
-        for ability, score in self.ability.items():
-            # Add the name to the list of names
-            ability_name_strings.append(centre_pad(ability, ability_width))
-            # Calculate the ability modifier
-            modifier = self.calculate_ability_modifier(score)
-            # Add the score and modifier to the list of scores
-            ability_score_strings.append(
-                centre_pad(f"{score:d}({modifier:+d})", ability_width)
+        lines.append(separator("-", line_width))
+
+        # Abilities: format the names and scores into one line each
+        ability_template = _ability_row_template(line_width, len(self.ability))
+        lines.append(
+            centre_pad(ability_template.format(*self.ability.keys()), line_width)
+        )
+        if self._ability_cells is None:
+            self._ability_cells = tuple(
+                f"{score:d}({self.calculate_ability_modifier(score):+d})"
+                for score in self.ability.values()
             )
-        # Join the names and scores into one line each, and centre and pad for the whole
-        # line width, before appending to the list
-        lines.append(centre_pad("".join(ability_name_strings), line_width))
-        lines.append(centre_pad("".join(ability_score_strings), line_width))
+        lines.append(
+            centre_pad(ability_template.format(*self._ability_cells), line_width)
+        )
 
         # Separator
-        lines.append("-" * line_width)
+        lines.append(separator("-", line_width))
 
         # Saving throws
         if self.saving_throws:
             throws = [f"{throw} {value}" for throw, value in self.saving_throws.items()]
-            lines.extend(format_list("Saving throws", throws, line_width))
+            format_list("Saving throws", throws, line_width, out=lines)
         # Skills
         if self.skills:
             skill_list = [f"{skill} {value}" for skill, value in self.skills.items()]
-            lines.extend(format_list("Skills", skill_list, line_width))
+            format_list("Skills", skill_list, line_width, out=lines)
         # Vulnerabilities
         if self.damage_vulnerabilities:
-            lines.extend(
-                format_list(
-                    "Damage vulnerabilities", self.damage_vulnerabilities, line_width
-                )
+            format_list(
+                "Damage vulnerabilities",
+                self.damage_vulnerabilities,
+                line_width,
+                out=lines,
             )
         # Resistances
         if self.damage_resistances:
-            lines.extend(
-                format_list("Damage resistances", self.damage_resistances, line_width)
+            format_list(
+                "Damage resistances", self.damage_resistances, line_width, out=lines
             )
         # Immunities
         if self.damage_immunities:
-            lines.extend(
-                format_list("Damage immunities", self.damage_immunities, line_width)
+            format_list(
+                "Damage immunities", self.damage_immunities, line_width, out=lines
             )
         if self.condition_immunities:
-            lines.extend(
-                format_list(
-                    "Condition immunities", self.condition_immunities, line_width
-                )
+            format_list(
+                "Condition immunities", self.condition_immunities, line_width, out=lines
             )
         # Passive perception
         lines.append(f"Passive perception: {self.passive_perception}")
@@ -242,9 +362,9 @@ class StatBlock:
             senses = [
                 f"{sense} {value}" for sense, value in self.special_senses.items()
             ]
-            lines.extend(format_list("Senses", senses, line_width))
+            format_list("Senses", senses, line_width, out=lines)
         # Languages
-        lines.extend(format_list("Languages", self.languages or ["none"], line_width))
+        format_list("Languages", self.languages or ["none"], line_width, out=lines)
 
         # Challenge rating
         lines.append(f"Challenge: {self.challenge} ({self.xp} XP)")
@@ -252,83 +372,139 @@ class StatBlock:
         # Separator
         lines.append("")
         lines.append(centre_pad("Special traits", line_width))
-        lines.append("-" * line_width)
+        lines.append(separator("-", line_width))
 
         if self.special_traits:
             for name, text in self.special_traits.items():
-                lines.extend(
-                    format_indented_paragraph(
-                        f"{name.capitalize()}: {text}", line_width
-                    )
+                format_indented_paragraph(
+                    f"{name.capitalize()}: {text}", line_width, out=lines
                 )
 
         # Separator and title
         lines.append("")
         lines.append(centre_pad("Actions", line_width))
-        lines.append("-" * line_width)
+        lines.append(separator("-", line_width))
 
         # Melee attacks
         if self.melee_attacks:
             for name, details in self.melee_attacks.items():
-                details_formatted = (
-                    f"{name.capitalize()}: melee weapon attack, "
-                    f"{details['hit']} to hit, reach {details['reach']}, "
-                    f"{details['targets']}. "
-                    f"Hit damage: {details['damage']}."
+                details_formatted = _MELEE_ATTACK_TEMPLATE.format_map(
+                    dict(details, name_cap=name.capitalize())
                 )
                 if "info" in details:
                     details_formatted += f" {details['info']}."
-                lines.extend(format_indented_paragraph(details_formatted, line_width))
+                format_indented_paragraph(details_formatted, line_width, out=lines)
 
         # Ranged attacks
         if self.ranged_attacks:
             for name, details in self.ranged_attacks.items():
-                details_formatted = (
-                    f"{name.capitalize()}: ranged weapon attack, "
-                    f"{details['hit']} to hit, range {details['range']},"
-                    f"{details['targets']}. "
-                    f"Hit damage: {details['damage']}."
+                details_formatted = _RANGED_ATTACK_TEMPLATE.format_map(
+                    dict(details, name_cap=name.capitalize())
                 )
                 if "info" in details:
                     details_formatted += f" {details['info']}."
-                lines.extend(format_indented_paragraph(details_formatted, line_width))
+                format_indented_paragraph(details_formatted, line_width, out=lines)
 
         if self.multiattack:
-            lines.extend(
-                format_indented_paragraph(
-                    f"Multiattack: {self.multiattack}", line_width
-                )
+            format_indented_paragraph(
+                f"Multiattack: {self.multiattack}", line_width, out=lines
             )
 
         # Other actions
         if self.other_actions:
             for name, text in self.other_actions.items():
                 action_formatted = f"{name.capitalize()}: {text}"
-                lines.extend(format_indented_paragraph(action_formatted, line_width))
+                format_indented_paragraph(action_formatted, line_width, out=lines)
 
         lines.append("")
 
         if self.description:
-            lines.extend(format_indented_paragraph(self.description, line_width))
+            format_indented_paragraph(self.description, line_width, out=lines)
 
         return lines
 
     @classmethod
-    def from_file(cls, filename: str):
+    def from_file(cls, filename: str, use_cache: bool = True):
         """Create a StatBlock from a YAML file.
 
         Parameters
         ----------
         filename: str
             Path to the YAML file
+        use_cache: bool
+            Whether to reuse the StatBlock from a previous load of the file, if it
+            hasn't changed since. Defaults to True.
+
+        Notes
+        -----
+        When `use_cache` is True, the returned StatBlock is shared with every other
+        caller that loads the same unchanged file, so it must be treated as
+        read-only apart from the internal `_ability_cells` memo, which
+        `battle_info` fills in on first use.
+        """
+        filename = str(filename)
+        if not use_cache:
+            return cls(**_load_stat_dict(filename, _STAT_KEYS))
+        return cls._from_file_cached(filename, os.stat(filename).st_mtime_ns)
+
+    @classmethod
+    def peek_header(cls, filename: str, use_cache: bool = True) -> Dict[str, object]:
+        """Read the name, challenge and creature type from a YAML stat file.
+
+        Notes
+        -----
+        The file is only parsed until all of `HEADER_KEYS` have been seen at its top
+        level, which is much cheaper than loading the whole stat block when they
+        come before long sections such as attacks and descriptions. If they can't
+        all be read that way (e.g. one is missing, or isn't a plain value), the
+        whole file is loaded with `from_file` instead.
+
+        Parameters
+        ----------
+        filename: str
+            Path to the YAML file
+        use_cache: bool
+            Passed to `from_file` if the whole file has to be loaded. Defaults to
+            True.
+
+        Returns
+        -------
+        dict
+            The value of each of `HEADER_KEYS`.
+
+        Raises
+        ------
+        FourhillsFileLoadError
+            If the file isn't valid YAML, or isn't a mapping.
         """
+        filename = str(filename)
         with open(filename) as f:
             try:
-                stat_dict = yaml.safe_load(f)
+                header = read_top_level_scalars(f, cls.HEADER_KEYS)
             except yaml.YAMLError as exc:
                 raise FourhillsFileLoadError(f"Error loading from {filename}.") from exc
+        if header is None:
+            stat_block = cls.from_file(filename, use_cache=use_cache)
+            header = {key: getattr(stat_block, key) for key in cls.HEADER_KEYS}
+        return header
+
+    @classmethod
+    def _from_file_cached(cls, filename: str, mtime: int):
+        """Return the cached StatBlock for a file, loading it if `mtime` has changed.
 
-            return cls(**stat_dict)
+        Parameters
+        ----------
+        filename: str
+            Path to the YAML file
+        mtime: int
+            The file's current modification time, in nanoseconds.
+        """
+        cached = _STATBLOCK_CACHE.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        stat_block = cls(**_load_stat_dict(filename, _STAT_KEYS))
+        _STATBLOCK_CACHE[filename] = (mtime, stat_block)
+        return stat_block
 
     @classmethod
     def from_name(cls, name: str, setting: Setting):
@@ -342,14 +518,42 @@ class StatBlock:
         setting: Setting
             The Setting object; this is used to find the setting root and
             subdirectories.
+
+        Notes
+        -----
+        Unless the setting's `use_cache` is False, the returned StatBlock may be
+        shared with other callers (see `from_file`), so it must not be modified
+        apart from the internal `_ability_cells` memo.
         """
         # Suspected path of the stat config file
-        stat_file = setting.monsters_dir / (name + ".yaml")
-        if not stat_file.is_file():
+        stat_file = str(setting.monsters_dir / (name + ".yaml"))
+        # Stat the file on every lookup, so that the cache sees any changes
+        try:
+            file_stat = os.stat(stat_file)
+        except FileNotFoundError:
+            file_stat = None
+        if file_stat is None or not S_ISREG(file_stat.st_mode):
             raise FourhillsFileNameError(
                 f"Stat file {stat_file} does not exist."
             )
-        return cls.from_file(str(stat_file))
+
+        try:
+            if not setting.use_cache:
+                return cls.from_file(stat_file, use_cache=False)
+            return cls._from_file_cached(stat_file, file_stat.st_mtime_ns)
+        except FileNotFoundError as exc:
+            # The file was deleted after it was found
+            raise FourhillsFileNameError(
+                f"Stat file {stat_file} does not exist."
+            ) from exc
+
+
+# The keys allowed at the top level of a stat file: the arguments of StatBlock's
+# __init__. This needs the finished class, so it's defined here rather than above;
+# StatBlock.from_file passes it to _load_stat_dict.
+_STAT_KEYS = frozenset(
+    stat_field.name for stat_field in dataclasses.fields(StatBlock) if stat_field.init
+)
 
 
 def example():
@@ -1,9 +1,18 @@
 import textwrap
+import functools
 import click
-from typing import List
+from typing import Iterable, List, Optional
 
 
-def format_indented_paragraph(text: str, line_width: int) -> list:
+@functools.lru_cache(maxsize=8)
+def _paragraph_wrapper(line_width: int) -> textwrap.TextWrapper:
+    """Return a (shared) TextWrapper which indents subsequent lines."""
+    return textwrap.TextWrapper(width=line_width, tabsize=4, subsequent_indent="    ")
+
+
+def format_indented_paragraph(
+    text: str, line_width: int, out: Optional[List[str]] = None
+) -> list:
     """Wrap a paragraph of text with approriate indentation on subsequent lines.
 
     Parameters
@@ -12,13 +21,20 @@ def format_indented_paragraph(text: str, line_width: int) -> list:
         The text to format.
     line_width : int
         The maximum width a line can be.
+    out : list of str or None
+        If a list, the wrapped lines are appended to it and it is returned. If None,
+        a new list is returned.
 
     Returns
     -------
     list of str
         The wrapped lines of text.
     """
-    return textwrap.wrap(text, width=line_width, tabsize=4, subsequent_indent="    ")
+    wrapped = _paragraph_wrapper(line_width).wrap(text)
+    if out is None:
+        return wrapped
+    out.extend(wrapped)
+    return out
 
 
 def wrap_lines_paragraph(lines: List[str], line_width: int) -> List[str]:
@@ -36,26 +52,30 @@ def wrap_lines_paragraph(lines: List[str], line_width: int) -> List[str]:
     list of str
         The wrapped lines of text.
     """
+    wrapper = _paragraph_wrapper(line_width)
     output_lines = list()
     for line in lines:
-        output_lines.extend(
-            textwrap.wrap(line, width=line_width, tabsize=4, subsequent_indent="    ")
-        )
+        output_lines.extend(wrapper.wrap(line))
 
     return output_lines
 
 
-def format_list(title: str, items: list, line_width: int) -> list:
+def format_list(
+    title: str, items: Iterable[str], line_width: int, out: Optional[List[str]] = None
+) -> list:
     """Join items with commas to create a text list, wrapping when necessary.
 
     Parameters
     ----------
     title : str
         The title to place at the start of the list.
-    items : list of str
-        List of the items
+    items : iterable of str
+        The items.
     line_width : int
         The maximum width a line can be.
+    out : list of str or None
+        If a list, the wrapped lines are appended to it and it is returned. If None,
+        a new list is returned.
 
     Returns
     -------
@@ -67,17 +87,29 @@ def format_list(title: str, items: list, line_width: int) -> list:
     # Add the title
     full_text = f"{title}: {item_list}"
     # Wrap the text
-    return format_indented_paragraph(full_text, line_width)
+    return format_indented_paragraph(full_text, line_width, out)
 
 
 def centre_pad(s, line_width):
-    """Pad a string with spaces, centre-aligned."""
-    return "{:^{width}}".format(s, width=line_width)
+    """Pad a string with spaces, centre-aligned.
+
+    Notes
+    -----
+    This is not the same as `str.center`, which puts the odd space of padding on the
+    left rather than the right.
+    """
+    return format(s, f"^{line_width}")
+
+
+@functools.lru_cache(maxsize=8)
+def separator(character: str, line_width: int) -> str:
+    """Return a separator line made of `character` repeated `line_width` times."""
+    return character * line_width
 
 
 def title(text: str, line_width: int) -> list:
     """Create a header by centre-aligning text and double-underlining."""
-    return [centre_pad(text, line_width), "=" * line_width]
+    return [centre_pad(text, line_width), separator("=", line_width)]
 
 
 def display_panes(
@@ -0,0 +1,282 @@
+import inspect
+import sys
+import yaml
+
+# Use the LibYAML-backed loader if PyYAML was built with it, as it is much faster
+# than the pure-Python one. Resolved once here so every load uses the same class.
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream):
+    """Parse a YAML stream safely, using LibYAML when it is available.
+
+    Parameters
+    ----------
+    stream : str or file
+        The YAML document, or an open file containing it.
+
+    Returns
+    -------
+    object
+        The parsed YAML document.
+    """
+    return yaml.load(stream, Loader=_LOADER)
+
+
+# Strings up to this length are interned by `intern`
+_INTERN_MAX_LENGTH = 32
+
+
+def intern(value):
+    """Intern `value` if it is a short ASCII string, otherwise return it unchanged.
+
+    Notes
+    -----
+    Short strings such as keys and damage types repeat across many documents, so
+    interning them saves memory. Longer free text (e.g. trait and attack names) is
+    unlikely to repeat, so it is left alone.
+    """
+    if type(value) is str and len(value) <= _INTERN_MAX_LENGTH and value.isascii():
+        return sys.intern(value)
+    return value
+
+
+# Used by the event-stream readers below to work out the type of plain scalars and
+# construct them
+_RESOLVER = yaml.resolver.Resolver()
+_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+# The safe constructors for scalar tags. Those for collection tags (e.g. !!seq) are
+# generators, which would return a generator rather than fail on a scalar node.
+_SCALAR_CONSTRUCTORS = {
+    tag: constructor
+    for tag, constructor in _CONSTRUCTOR.yaml_constructors.items()
+    if tag is not None and not inspect.isgeneratorfunction(constructor)
+}
+_STR_TAG = "tag:yaml.org,2002:str"
+# Marks that no mapping key is pending in `read_top_level_scalars`
+_NO_KEY = object()
+
+
+def _construct_scalar(event):
+    """Construct the value of a scalar event, or raise KeyError if it isn't safe."""
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = _RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+    if tag == _STR_TAG:
+        return event.value
+    constructor = _SCALAR_CONSTRUCTORS[tag]
+    return constructor(_CONSTRUCTOR, yaml.ScalarNode(tag, event.value))
+
+
+def load_mapping(stream, keys):
+    r"""Parse a YAML mapping directly from the parser's event stream.
+
+    Notes
+    -----
+    This skips building the node graph that `safe_load` composes before
+    constructing Python objects. Scalars are resolved and constructed with PyYAML's
+    own safe resolver and constructor, so the result is equal to what `safe_load`
+    returns. It only handles plain documents: if the document isn't a single
+    mapping, uses anchors, aliases, merge keys, tags on collections, tags without a
+    safe constructor or non-scalar keys, or has a top-level key not in `keys`, None
+    is returned so that the caller can fall back to `safe_load`.
+
+    Keys are passed to `intern` as the mappings are built, as the same keys tend to
+    appear in many documents.
+
+    Parameters
+    ----------
+    stream : str or file
+        The YAML document, or an open file containing it.
+    keys : set of str
+        The top-level keys that are allowed in the mapping.
+
+    Returns
+    -------
+    dict or None
+        The parsed mapping, or None if it couldn't be parsed this way.
+
+    Examples
+    --------
+    Nested collections, implicitly typed scalars, block scalars and standard scalar
+    tags give the same result as `safe_load`:
+
+    >>> load_mapping("a: [1, 2.5, null, true, '8']\nb: {c: [x, {d: 0x1F}]}", {"a", "b"})
+    {'a': [1, 2.5, None, True, '8'], 'b': {'c': ['x', {'d': 31}]}}
+    >>> load_mapping("a: |\n  two\n  lines\nb: !!str 5\nc:", {"a", "b", "c"})
+    {'a': 'two\nlines\n', 'b': '5', 'c': None}
+
+    Anything else is left to `safe_load`:
+
+    >>> load_mapping("a: &x 1\nb: *x", {"a", "b"}) is None  # anchors and aliases
+    True
+    >>> load_mapping("a: &x {c: 1}\nb:\n  <<: *x", {"a", "b"}) is None  # merge keys
+    True
+    >>> load_mapping("a: !!set {c}", {"a"}) is None  # tags on collections
+    True
+    >>> load_mapping("a: !!seq x", {"a"}) is None  # collection tags on scalars
+    True
+    >>> load_mapping("a: 1\n---\na: 2", {"a"}) is None  # several documents
+    True
+    >>> load_mapping("- a\n- b", {"a"}) is None  # not a mapping
+    True
+    >>> load_mapping("? [a, b]\n: c", {"a"}) is None  # non-scalar keys
+    True
+    >>> load_mapping("a: 1\nz: 2", {"a"}) is None  # keys not in `keys`
+    True
+    """
+    # Containers being built. Each entry is [container, key]; for mappings, key is
+    # a 1-tuple holding the key while its value is being parsed (so that a key of
+    # None can be told apart from no key).
+    stack = []
+    root = None
+    documents = 0
+
+    for event in yaml.parse(stream, Loader=_LOADER):
+        event_type = type(event)
+        if event_type is yaml.DocumentStartEvent:
+            documents += 1
+            if documents > 1:
+                return None
+            continue
+        elif event_type is yaml.ScalarEvent:
+            if event.anchor is not None or not stack:
+                return None
+            try:
+                value = _construct_scalar(event)
+            except KeyError:
+                return None
+        elif (
+            event_type is yaml.MappingStartEvent
+            or event_type is yaml.SequenceStartEvent
+        ):
+            if event.anchor is not None or event.tag not in (None, "!"):
+                return None
+            value = {} if event_type is yaml.MappingStartEvent else []
+        elif event_type is yaml.MappingEndEvent or event_type is yaml.SequenceEndEvent:
+            root = stack.pop()[0]
+            continue
+        elif event_type is yaml.AliasEvent:
+            return None
+        else:
+            continue
+
+        if stack:
+            entry = stack[-1]
+            container = entry[0]
+            if type(container) is list:
+                container.append(value)
+            elif entry[1] is None:
+                # This is a key; it must be hashable, and at the top level, allowed
+                if type(value) in (dict, list) or (
+                    len(stack) == 1 and value not in keys
+                ):
+                    return None
+                entry[1] = (intern(value),)
+            else:
+                container[entry[1][0]] = value
+                entry[1] = None
+        elif type(value) is not dict:
+            return None
+
+        if type(value) in (dict, list):
+            stack.append([value, None])
+
+    return root
+
+
+def read_top_level_scalars(stream, keys):
+    r"""Read the values of some top-level keys from a YAML mapping.
+
+    Notes
+    -----
+    The parser's event stream is only read as far as needed: parsing stops as soon
+    as all of `keys` have been seen at the top level of the mapping, so the rest of
+    the document (e.g. long descriptions) isn't parsed at all. Because of this, if a
+    key appears more than once the first value is returned, whereas `safe_load`
+    would keep the last.
+
+    None is returned if the document ends before all of the keys are found, if it
+    isn't a mapping, if any of the wanted values isn't a plain scalar (e.g. it is a
+    list or an alias), or if a key can't be read as a scalar. Callers should then
+    fall back to loading the whole document.
+
+    Parameters
+    ----------
+    stream : str or file
+        The YAML document, or an open file containing it.
+    keys : collection of str
+        The top-level keys to read.
+
+    Returns
+    -------
+    dict or None
+        The value of each key, or None if they couldn't all be read this way.
+
+    Examples
+    --------
+    >>> read_top_level_scalars("a: 1\nb: [x, y]\nc: text\nd: {e: 2}", {"a", "c"})
+    {'a': 1, 'c': 'text'}
+    >>> read_top_level_scalars("a: 1\nb: 2", {"a", "z"}) is None  # missing key
+    True
+    >>> read_top_level_scalars("a: [1, 2]", {"a"}) is None  # not a scalar
+    True
+    >>> read_top_level_scalars("- a\n- b", {"a"}) is None  # not a mapping
+    True
+
+    Multi-line plain scalars are read in full, as the parser sees the whole value:
+
+    >>> read_top_level_scalars("name: Long\n  goblin chief\nx: 1", {"name"})
+    {'name': 'Long goblin chief'}
+    """
+    found = {}
+    # Nesting depth: 1 is inside the top-level mapping
+    depth = 0
+    # The top-level key whose value comes next, or _NO_KEY if a key comes next
+    key = _NO_KEY
+
+    for event in yaml.parse(stream, Loader=_LOADER):
+        event_type = type(event)
+        if (
+            event_type is yaml.MappingStartEvent
+            or event_type is yaml.SequenceStartEvent
+        ):
+            if depth == 0 and event_type is not yaml.MappingStartEvent:
+                return None
+            if depth == 1:
+                # A non-scalar key, or a non-scalar value for a key we want
+                if key is _NO_KEY or key in keys:
+                    return None
+                key = _NO_KEY
+            depth += 1
+        elif event_type is yaml.MappingEndEvent or event_type is yaml.SequenceEndEvent:
+            depth -= 1
+            if depth == 0:
+                # The end of the top-level mapping
+                return None
+        elif event_type is yaml.ScalarEvent or event_type is yaml.AliasEvent:
+            if depth == 0:
+                return None
+            if depth > 1:
+                continue
+            if key is _NO_KEY:
+                if event_type is yaml.AliasEvent:
+                    return None
+                try:
+                    key = _construct_scalar(event)
+                except KeyError:
+                    return None
+            elif key in keys:
+                if event_type is yaml.AliasEvent:
+                    return None
+                try:
+                    found[key] = _construct_scalar(event)
+                except KeyError:
+                    return None
+                if len(found) == len(keys):
+                    return found
+                key = _NO_KEY
+            else:
+                key = _NO_KEY
+
+    return None